@@ -0,0 +1,153 @@
+import threading
+import time
+
+
+class Subscription:
+    """One listener's view of an event's availability. Holds only the latest snapshot.
+
+    A slow reader never builds up a backlog: newer snapshots replace ones it
+    hasn't read yet.
+    """
+
+    def __init__(self, event_id):
+        self.event_id = event_id
+        self._snapshot = None
+        self._ready = threading.Event()
+
+    def deliver(self, snapshot):
+        self._snapshot = snapshot
+        self._ready.set()
+
+    def get(self, timeout):
+        """Returns the newest undelivered snapshot, or ``None`` if none arrives within ``timeout`` seconds."""
+        if not self._ready.wait(timeout):
+            return None
+        self._ready.clear()
+        return self._snapshot
+
+
+class AvailabilityBroker:
+    """In-process pub/sub that pushes events' ticket availability to subscribers.
+
+    Publishing only marks an event as changed. A dispatcher thread loads the
+    availability of changed events that have subscribers at most ``max_rate``
+    times a second, however fast bookings arrive, and hands each snapshot to
+    every subscriber of the event. Events are also reloaded every
+    ``refresh_interval`` seconds to pick up bookings made by other workers.
+    ``load(event_ids)`` returns ``{event_id: snapshot}`` and is only called
+    from the dispatcher thread. At most ``max_subscribers`` listeners are
+    accepted at once (``None`` for no limit).
+    """
+
+    def __init__(self, load, max_rate=2, refresh_interval=5, max_subscribers=None):
+        self.load = load
+        self.min_interval = 1 / max_rate
+        self.refresh_interval = refresh_interval
+        self.max_subscribers = max_subscribers
+        self._lock = threading.Lock()
+        self._subscribers = {}
+        self._changed = set()
+        self._latest = {}
+        self._loaded_at = {}
+        self._wakeup = threading.Event()
+        self._thread = None
+        self.published = 0
+        self.dispatched = 0
+        self.rejected = 0
+
+    def subscribe(self, event_id, snapshot=None, loaded_at=None):
+        """Registers a listener, or returns ``None`` when ``max_subscribers`` are already listening.
+
+        ``snapshot`` is what the listener already has, loaded at ``loaded_at`` (a
+        ``time.monotonic()`` reading taken before the load). Whichever of it and
+        the broker's copy was loaded later is kept, so unchanged data isn't resent
+        and an older copy never replaces a newer one.
+        """
+        subscription = Subscription(event_id)
+        with self._lock:
+            if self.max_subscribers is not None and \
+                    sum(len(subscribers) for subscribers in self._subscribers.values()) >= self.max_subscribers:
+                self.rejected += 1
+                return None
+            if snapshot is not None:
+                self._offer(event_id, snapshot, time.monotonic() if loaded_at is None else loaded_at)
+            self._subscribers.setdefault(event_id, set()).add(subscription)
+            latest = self._latest.get(event_id)
+            if latest is not None and latest != snapshot:
+                subscription.deliver(latest)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='availability-broker', daemon=True)
+                self._thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.event_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.event_id]
+                    self._latest.pop(subscription.event_id, None)
+                    self._loaded_at.pop(subscription.event_id, None)
+
+    def publish(self, *event_ids):
+        """Notes that the availability of ``event_ids`` changed."""
+        with self._lock:
+            self.published += len(event_ids)
+            watched = [event_id for event_id in event_ids if event_id in self._subscribers]
+            self._changed.update(watched)
+        if watched:
+            self._wakeup.set()
+
+    def _due(self, now):
+        with self._lock:
+            due = {event_id for event_id in self._subscribers
+                   if now - self._loaded_at.get(event_id, 0) >= self.refresh_interval}
+            due |= self._changed & self._subscribers.keys()
+            self._changed.clear()
+        return due
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.refresh_interval)
+            self._wakeup.clear()
+            started = time.monotonic()
+            event_ids = self._due(started)
+            if event_ids:
+                try:
+                    snapshots = self.load(sorted(event_ids))
+                except Exception:
+                    snapshots = {}
+                    with self._lock:
+                        self._changed.update(event_ids) # Try again on the next round
+                self._dispatch(snapshots, started)
+            # Changes arriving while we pause are coalesced into the next round
+            time.sleep(max(0.0, self.min_interval - (time.monotonic() - started)))
+
+    def _dispatch(self, snapshots, loaded_at):
+        with self._lock:
+            for event_id, snapshot in snapshots.items():
+                if event_id in self._subscribers:
+                    self._offer(event_id, snapshot, loaded_at)
+
+    def _offer(self, event_id, snapshot, loaded_at):
+        """Keeps ``snapshot`` unless the broker already has a later one, pushing it if it changed. Needs the lock."""
+        if loaded_at < self._loaded_at.get(event_id, loaded_at):
+            return
+        self._loaded_at[event_id] = loaded_at
+        if snapshot == self._latest.get(event_id):
+            return
+        self._latest[event_id] = snapshot
+        for subscription in self._subscribers.get(event_id, ()):
+            subscription.deliver(snapshot)
+            self.dispatched += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'events': len(self._subscribers),
+                'subscribers': sum(len(subscribers) for subscribers in self._subscribers.values()),
+                'published': self.published,
+                'dispatched': self.dispatched,
+                'rejected': self.rejected,
+            }
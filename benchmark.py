@@ -0,0 +1,583 @@
+#!/usr/bin/env python
+"""
+Benchmark Script for EventFlow
+
+This script exercises performance-critical paths of the application against
+the configured database. It creates its own fixture data and removes it
+again when it is done.
+
+Usage:
+    python benchmark.py booking-stress --capacity 500 --threads 32
+    python benchmark.py ticket-issuance --sizes 1 10 100 1000
+    python benchmark.py password-hashing --rounds 10 11 12 13
+    python benchmark.py seat-allocation --capacity 50000
+    python benchmark.py ticket-export --sizes 10000 100000
+    python benchmark.py index-usage --events 500
+    python benchmark.py route-load --clients 16 --duration 30   # after generate_data.py
+    python benchmark.py replica-cache
+"""
+
+import argparse
+import datetime
+import os
+import random
+import re
+import resource
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+import app as eventflow
+from app import app, db, User, Event, Venue, Ticket, Order, TicketType, EventSalesSummary, Speaker, \
+    InventoryHold, SearchTerm, book_tickets, InsufficientInventoryError, issue_tickets, export_event_tickets, \
+    delete_events
+from generate_data import LOAD_TEST_PASSWORD, attendee_email, organizer_email
+from cache import LocalStore
+from passwords import PasswordHasher
+from replicas import Replica
+from seating import SeatMap
+
+
+def create_fixture(capacity):
+    """Creates a venue, event, ticket type and attendee used by a benchmark run."""
+    stamp = time.strftime('%Y%m%d%H%M%S')
+    venue = Venue(name=f'Benchmark Venue {stamp}', capacity=capacity, city='Benchmark')
+    user = User(name='Benchmark Attendee', email=f'benchmark-{stamp}@eventflow.local',
+                password='!', user_type='attendee')
+    db.session.add_all([venue, user])
+    db.session.flush()
+
+    event = Event(name=f'Benchmark Event {stamp}', description='Benchmark fixture',
+                  date=datetime.date.today(), time=datetime.time(19, 0),
+                  location_id=venue.venue_id)
+    db.session.add(event)
+    db.session.flush()
+
+    ticket_type = TicketType(event_id=event.event_id, type='general admission',
+                             price=10, quantity=capacity)
+    db.session.add(ticket_type)
+    db.session.flush()
+    db.session.add(EventSalesSummary(ticket_type_id=ticket_type.ticket_type_id, event_id=event.event_id,
+                                     sold_count=0, order_count=0, gross_revenue=0, remaining=capacity))
+    db.session.commit()
+    return {
+        'venue_id': venue.venue_id,
+        'user_id': user.user_id,
+        'event_id': event.event_id,
+        'ticket_type_id': ticket_type.ticket_type_id,
+    }
+
+
+def remove_fixture(fixture):
+    """Deletes everything a benchmark run created."""
+    Ticket.query.filter_by(event_id=fixture['event_id']).delete(synchronize_session=False)
+    Order.query.filter(Order.user_id == fixture['user_id']).delete(synchronize_session=False)
+    EventSalesSummary.query.filter_by(event_id=fixture['event_id']).delete(synchronize_session=False)
+    TicketType.query.filter_by(event_id=fixture['event_id']).delete(synchronize_session=False)
+    Event.query.filter_by(event_id=fixture['event_id']).delete(synchronize_session=False)
+    Venue.query.filter_by(venue_id=fixture['venue_id']).delete(synchronize_session=False)
+    User.query.filter_by(user_id=fixture['user_id']).delete(synchronize_session=False)
+    db.session.commit()
+
+
+def booking_stress(capacity, threads, attempts, quantity):
+    """Hammers one ticket type from many threads and checks it never oversells."""
+    with app.app_context():
+        fixture = create_fixture(capacity)
+
+    counts = {'booked': 0, 'sold_out': 0, 'errors': 0}
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(threads)
+
+    def worker():
+        with app.app_context():
+            start_barrier.wait()
+            for _ in range(attempts):
+                ticket_type = db.session.get(TicketType, fixture['ticket_type_id'])
+                try:
+                    book_tickets(fixture['user_id'], ticket_type, quantity)
+                    outcome = 'booked'
+                except InsufficientInventoryError:
+                    outcome = 'sold_out'
+                except Exception as e:
+                    print(f"Booking failed: {e}", file=sys.stderr)
+                    outcome = 'errors'
+                with lock:
+                    counts[outcome] += 1
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    with app.app_context():
+        sold = Ticket.query.filter_by(event_id=fixture['event_id']).count()
+        seats = db.session.query(db.func.count(Ticket.seat_number),
+                                 db.func.count(db.distinct(Ticket.seat_number))) \
+            .filter_by(event_id=fixture['event_id']).one()
+        remaining = db.session.get(TicketType, fixture['ticket_type_id']).quantity
+        summary = db.session.get(EventSalesSummary, fixture['ticket_type_id'])
+        summary = (summary.sold_count, summary.remaining)
+        remove_fixture(fixture)
+
+    total = sum(counts.values())
+    print(f"Threads:            {threads}")
+    print(f"Booking attempts:   {total} ({total / elapsed:.1f}/s)")
+    print(f"Successful orders:  {counts['booked']}")
+    print(f"Sold out:           {counts['sold_out']}")
+    print(f"Errors:             {counts['errors']}")
+    print(f"Tickets sold:       {sold} of {capacity} (remaining {remaining})")
+    print(f"Seats assigned:     {seats[0]} ({seats[1]} distinct)")
+    print(f"Sales summary:      {summary[0]} sold, {summary[1]} remaining")
+
+    if sold > capacity or sold + remaining != capacity:
+        print("FAILED: inventory was oversold or lost.")
+        return False
+    if seats[0] != seats[1]:
+        print("FAILED: a seat was sold twice.")
+        return False
+    if summary != (sold, remaining):
+        print("FAILED: the sales summary disagrees with the tickets sold.")
+        return False
+    print("OK: no overselling detected.")
+    return True
+
+
+def book_tickets_row_by_row(user_id, ticket_type, quantity):
+    """Baseline booking that adds one Ticket object per seat, for comparison."""
+    order = Order(user_id=user_id, date=datetime.datetime.now(),
+                  total_price=ticket_type.price * quantity)
+    db.session.add(order)
+    db.session.flush()
+    for _ in range(quantity):
+        db.session.add(Ticket(event_id=ticket_type.event_id, order_id=order.order_id,
+                              price=ticket_type.price, type=ticket_type.type))
+    ticket_type.quantity -= quantity
+    db.session.commit()
+
+
+def ticket_issuance(sizes, repeats):
+    """Measures per-order latency of bulk ticket issuance against a row-by-row baseline."""
+    with app.app_context():
+        fixture = create_fixture(sum(sizes) * repeats * 2)
+        ticket_type = db.session.get(TicketType, fixture['ticket_type_id'])
+
+        print(f"{'Tickets':>8} {'Row-by-row (ms)':>16} {'Bulk (ms)':>10} {'Speedup':>8}")
+        for size in sizes:
+            row_times, bulk_times = [], []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                book_tickets_row_by_row(fixture['user_id'], ticket_type, size)
+                row_times.append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                book_tickets(fixture['user_id'], ticket_type, size)
+                bulk_times.append(time.perf_counter() - started)
+
+            row_ms = statistics.median(row_times) * 1000
+            bulk_ms = statistics.median(bulk_times) * 1000
+            print(f"{size:>8} {row_ms:>16.2f} {bulk_ms:>10.2f} {row_ms / bulk_ms:>7.1f}x")
+
+        remove_fixture(fixture)
+
+
+def password_hashing(rounds_list, workers, duration):
+    """Measures password checks (logins) per second at different bcrypt cost factors."""
+    print(f"{'Cost':>4} {'Inline/s':>9} {'Pool/s':>8} {'Per core/s':>11}  (pool of {workers} processes)")
+    for rounds in rounds_list:
+        inline = PasswordHasher(rounds=rounds, workers=0)
+        hashed = inline.hash('correct horse battery staple')
+
+        checks = 0
+        started = time.perf_counter()
+        while time.perf_counter() - started < duration:
+            inline.verify(hashed, 'correct horse battery staple')
+            checks += 1
+        inline_rate = checks / (time.perf_counter() - started)
+
+        pooled = PasswordHasher(rounds=rounds, workers=workers)
+        pooled.verify(hashed, 'warm up the pool')
+        total = max(int(inline_rate * workers * duration), workers)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers * 4) as clients:
+            list(clients.map(lambda _: pooled.verify(hashed, 'correct horse battery staple'), range(total)))
+        pool_rate = total / (time.perf_counter() - started)
+        pooled.shutdown()
+
+        print(f"{rounds:>4} {inline_rate:>9.1f} {pool_rate:>8.1f} {pool_rate / workers:>11.1f}")
+
+
+def seat_allocation(capacity, group_size, fills, allocations):
+    """Measures best-available seat allocation latency at different occupancy levels."""
+    print(f"{'Occupancy':>9} {'Median (us)':>12} {'Max (us)':>9} {'Contiguous':>11}")
+    for fill in fills:
+        seat_map = SeatMap(capacity)
+        seat_map.mark_taken(random.sample(range(1, capacity + 1), int(capacity * fill)))
+        timings, contiguous = [], 0
+        for _ in range(allocations):
+            started = time.perf_counter()
+            seats = seat_map.allocate(group_size)
+            timings.append(time.perf_counter() - started)
+            if seats is None:
+                break
+            contiguous += seats[-1] - seats[0] == group_size - 1
+        print(f"{fill:>9.0%} {statistics.median(timings) * 1e6:>12.1f} "
+              f"{max(timings) * 1e6:>9.1f} {contiguous / len(timings):>11.0%}")
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def ticket_export(sizes, batch_size):
+    """Measures streaming export throughput and memory as the ticket count grows."""
+    with app.app_context():
+        fixture = create_fixture(max(sizes))
+        issued = 0
+
+        print(f"{'Rows':>8} {'Format':>7} {'Rows/s':>10} {'MB':>7} {'Heap peak (MB)':>15} {'Peak RSS (MB)':>14}")
+        for size in sorted(sizes):
+            while issued < size:
+                count = min(1000, size - issued)
+                order = Order(user_id=fixture['user_id'], date=datetime.datetime.now(), total_price=10 * count)
+                db.session.add(order)
+                db.session.flush()
+                issue_tickets(order.order_id, fixture['event_id'], 'general admission', 10, count)
+                db.session.commit()
+                issued += count
+
+            for fmt in ('csv', 'ndjson'):
+                written = 0
+                started = time.perf_counter()
+                for chunk in export_event_tickets(fixture['event_id'], fmt, batch_size):
+                    written += len(chunk)
+                rate = size / (time.perf_counter() - started)
+
+                # A second pass under tracemalloc shows the Python heap stays flat as rows grow
+                tracemalloc.start()
+                for chunk in export_event_tickets(fixture['event_id'], fmt, batch_size):
+                    pass
+                heap_peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+                tracemalloc.stop()
+
+                print(f"{size:>8} {fmt:>7} {rate:>10.0f} {written / 2 ** 20:>7.1f} "
+                      f"{heap_peak:>15.1f} {peak_rss_mb():>14.1f}")
+
+        remove_fixture(fixture)
+
+
+def explain(query):
+    """Returns ``(table, index)`` pairs from the database's plan for ``query``; ``index`` is None for a full scan."""
+    dialect = db.engine.dialect
+    sql = str(query.statement.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+    if dialect.name == 'sqlite':
+        plan = []
+        for row in db.session.execute(db.text(f'EXPLAIN QUERY PLAN {sql}')):
+            words = row.detail.split()
+            if words[0] in ('SCAN', 'SEARCH'):
+                index = words[words.index('INDEX') + 1] if 'INDEX' in words else None
+                if 'PRIMARY' in words:
+                    index = 'PRIMARY'
+                plan.append((words[1], index))
+        return plan
+    return [(row['table'], row['key']) for row in db.session.execute(db.text(f'EXPLAIN {sql}')).mappings()]
+
+
+def hot_queries(fixture, event_ids):
+    """The lookups on request paths that must be served by an index, with the table each one reads."""
+    event_id = event_ids[len(event_ids) // 2]
+    now = datetime.datetime.now()
+    return [
+        ('Ticket type by event and name', 'tickettype',
+         TicketType.query.filter_by(event_id=event_id, type='general admission')),
+        ('Tickets in an order', 'ticket', Ticket.query.filter_by(order_id=1)),
+        ('Tickets by event and type', 'ticket', Ticket.query.filter_by(event_id=event_id, type='general admission')),
+        ("A user's orders by date", 'order',
+         Order.query.filter_by(user_id=fixture['user_id']).order_by(Order.date.desc(), Order.order_id.desc()).limit(10)),
+        ('Events by date', 'event', Event.query.order_by(Event.date, Event.event_id).limit(12)),
+        ("An organizer's events", 'event', Event.query.filter_by(organizer_id=fixture['user_id'])),
+        ("An event's speakers", 'speaker', Speaker.query.filter_by(event_id=event_id)),
+        ('Events in a city', 'venue', Venue.query.filter_by(city='Benchmark')),
+        ("An event's sales summaries", 'event_sales_summary', EventSalesSummary.query.filter_by(event_id=event_id)),
+        ('Expired holds', 'inventory_hold',
+         InventoryHold.query.filter(InventoryHold.expires_at <= now).order_by(InventoryHold.expires_at).limit(500)),
+        ('Search postings of a record', 'search_term', SearchTerm.query.filter_by(entity_type='event', entity_id=event_id)),
+    ]
+
+
+def index_usage(events, tickets_per_event):
+    """Seeds events, tickets and orders, then EXPLAINs each hot query and fails if one scans its table."""
+    with app.app_context():
+        fixture = create_fixture(events * tickets_per_event)
+        venue_id = fixture['venue_id']
+        event_ids = [fixture['event_id']]
+        for day in range(1, events):
+            event = Event(name=f'Benchmark Event {day}', description='Benchmark fixture',
+                          date=datetime.date.today() + datetime.timedelta(days=day), time=datetime.time(19, 0),
+                          location_id=venue_id, organizer_id=fixture['user_id'] if day % 10 == 0 else None)
+            db.session.add(event)
+            db.session.flush()
+            db.session.add_all([
+                TicketType(event_id=event.event_id, type='general admission', price=10, quantity=tickets_per_event),
+                Speaker(name=f'Benchmark Speaker {day}', event_id=event.event_id),
+            ])
+            event_ids.append(event.event_id)
+        for event_id in event_ids:
+            order = Order(user_id=fixture['user_id'], date=datetime.datetime.now(), total_price=10 * tickets_per_event)
+            db.session.add(order)
+            db.session.flush()
+            issue_tickets(order.order_id, event_id, 'general admission', 10, tickets_per_event)
+        db.session.commit()
+
+        failures = 0
+        print(f"{'Query':<32} {'Table':<20} Index")
+        for name, table, query in hot_queries(fixture, event_ids):
+            indexes = [index for plan_table, index in explain(query) if plan_table.strip('`') == table]
+            index = indexes[0] if indexes else None
+            failures += index is None
+            print(f"{name:<32} {table:<20} {index or 'FULL SCAN'}")
+
+        delete_events(event_ids[1:])
+        remove_fixture(fixture)
+
+    if failures:
+        print(f"FAILED: {failures} hot queries scan their table.")
+        return False
+    print("OK: every hot query uses an index.")
+    return True
+
+
+# Weighted mix of page views a client makes; 'book_ticket' also confirms the hold it places
+ROUTE_MIX = [('index', 15), ('list_events', 25), ('event_details', 30), ('book_ticket', 5),
+             ('my_tickets', 15), ('dashboard', 10)]
+
+statements = threading.local()
+
+
+@db.event.listens_for(Engine, 'before_cursor_execute')
+def count_statement(conn, cursor, statement, parameters, context, executemany):
+    statements.count = getattr(statements, 'count', 0) + 1
+
+
+def sign_in(client, email):
+    response = client.post('/login', data={'email': email, 'password': LOAD_TEST_PASSWORD})
+    if response.status_code != 302:
+        raise RuntimeError(f"Could not sign in as {email}; run generate_data.py first.")
+
+
+def percentile(latencies, pct):
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def route_load(clients, duration, seed):
+    """Drives the real routes from concurrent signed-in clients over generated data."""
+    with app.app_context():
+        today = datetime.date.today()
+        # Upcoming events outside the waiting room with tickets left, and a ticket type to book for each
+        ticket_types = dict(db.session.query(TicketType.event_id, TicketType.type)
+                            .join(Event, TicketType.event_id == Event.event_id)
+                            .filter(Event.date >= today, Event.admission_rate.is_(None), TicketType.quantity > 0))
+        event_ids = list(ticket_types)
+        attendees = User.query.filter(User.email.like(attendee_email('%'))).count()
+        organizers = User.query.filter(User.email.like(organizer_email('%'))).count()
+    if not event_ids or not attendees or not organizers:
+        print("No generated data found; run generate_data.py first.")
+        return
+
+    samples = {route: [] for route, _ in ROUTE_MIX}
+    samples['confirm_hold'] = []
+    errors = []
+    lock = threading.Lock()
+    routes, weights = zip(*ROUTE_MIX)
+
+    def request(record, client, method, url, **kwargs):
+        statements.count = 0
+        started = time.perf_counter()
+        response = getattr(client, method)(url, **kwargs)
+        elapsed = time.perf_counter() - started
+        if response.status_code >= 400:
+            errors.append(f"{method.upper()} {url}: {response.status_code}")
+        record.append((elapsed, statements.count))
+        return response
+
+    def worker(number):
+        rng = random.Random(seed + number)
+        attendee, organizer = app.test_client(), app.test_client()
+        sign_in(attendee, attendee_email(number % attendees))
+        sign_in(organizer, organizer_email(number % organizers))
+        local = {route: [] for route in samples}
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            route = rng.choices(routes, weights)[0]
+            event_id = rng.choice(event_ids)
+            if route == 'index':
+                request(local[route], attendee, 'get', '/')
+            elif route == 'list_events':
+                request(local[route], attendee, 'get', '/events')
+            elif route == 'event_details':
+                request(local[route], attendee, 'get', f'/events/{event_id}')
+            elif route == 'book_ticket':
+                response = request(local[route], attendee, 'post', f'/book_ticket/{event_id}',
+                                   data={'ticket_type': ticket_types[event_id], 'quantity': 1})
+                if '/holds/' in response.location:
+                    request(local['confirm_hold'], attendee, 'post', f"{response.location}/confirm")
+            elif route == 'my_tickets':
+                request(local[route], attendee, 'get', '/my-tickets')
+            else:
+                request(local[route], organizer, 'get', '/dashboard')
+        with lock:
+            for route, records in local.items():
+                samples[route].extend(records)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(worker, range(clients)))
+    elapsed = time.perf_counter() - started
+
+    print(f"{'Route':<14} {'Requests':>9} {'Req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'SQL/req':>8}")
+    for route, records in samples.items():
+        if not records:
+            continue
+        latencies = [latency * 1000 for latency, _ in records]
+        sql = statistics.mean(count for _, count in records)
+        print(f"{route:<14} {len(records):>9} {len(records) / elapsed:>8.1f} {percentile(latencies, 50):>8.1f} "
+              f"{percentile(latencies, 95):>8.1f} {percentile(latencies, 99):>8.1f} {sql:>8.1f}")
+    total = sum(len(records) for records in samples.values())
+    print(f"Clients: {clients}, requests: {total} ({total / elapsed:.1f}/s), errors: {len(errors)}")
+    for error in errors[:10]:
+        print(f"  {error}", file=sys.stderr)
+
+
+def page_availability(client, event_id, ticket_type_id):
+    """Returns the 'Available' count an anonymous visitor sees on the event page."""
+    page = client.get(f'/events/{event_id}').get_data(as_text=True)
+    match = re.search(rf'data-ticket-type-id="{ticket_type_id}".*?Available: (\d+)', page, re.S)
+    return int(match.group(1)) if match else None
+
+
+def replica_cache(capacity, quantity):
+    """Checks that a booking is never hidden by a page cached from a lagging read replica.
+
+    The replica is an in-memory copy of the fixture taken before the booking and
+    never updated, i.e. a replica that lags forever.
+    """
+    with app.app_context():
+        fixture = create_fixture(capacity)
+        lagging = create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+        tables = [Venue.__table__, Event.__table__, Speaker.__table__, TicketType.__table__]
+        db.metadata.create_all(lagging, tables=tables)
+        with lagging.begin() as replica:
+            for table, column in zip(tables, ('venue_id', 'event_id', 'event_id', 'event_id')):
+                key = fixture['venue_id'] if column == 'venue_id' else fixture['event_id']
+                rows = [dict(row._mapping) for row in
+                        db.session.execute(db.select(table).where(table.c[column] == key))]
+                if rows:
+                    replica.execute(table.insert(), rows)
+
+    replicas, store, ttl = eventflow.replica_router.replicas, eventflow.page_store, app.config['PAGE_CACHE_TTL']
+    eventflow.replica_router.replicas = [Replica('lagging', lagging)]
+    eventflow.page_store = LocalStore(ttl=60)
+    app.config['PAGE_CACHE_TTL'] = 60
+    try:
+        visitor = app.test_client()
+        event_id, ticket_type_id = fixture['event_id'], fixture['ticket_type_id']
+        before = page_availability(visitor, event_id, ticket_type_id)
+        cached = page_availability(visitor, event_id, ticket_type_id)
+        with app.app_context():
+            book_tickets(fixture['user_id'], db.session.get(TicketType, ticket_type_id), quantity)
+        after = page_availability(visitor, event_id, ticket_type_id)
+        with lagging.connect() as connection:
+            on_replica = connection.execute(db.select(TicketType.quantity)
+                                            .where(TicketType.ticket_type_id == ticket_type_id)).scalar()
+    finally:
+        eventflow.replica_router.replicas, eventflow.page_store = replicas, store
+        app.config['PAGE_CACHE_TTL'] = ttl
+        with app.app_context():
+            remove_fixture(fixture)
+
+    print(f"Available before booking:        {before} (then {cached} from the cache)")
+    print(f"Lagging replica after booking:   {on_replica}")
+    print(f"Cached page after booking:       {after} (expected {capacity - quantity})")
+    if after != capacity - quantity:
+        print("FAILED: the page cache stored availability read from the lagging replica.")
+        return False
+    print("OK: cache misses are rendered from the primary.")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EventFlow benchmarks')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    stress = commands.add_parser('booking-stress', help='Concurrent booking against one ticket type')
+    stress.add_argument('--capacity', type=int, default=500)
+    stress.add_argument('--threads', type=int, default=32)
+    stress.add_argument('--attempts', type=int, default=25, help='Bookings per thread')
+    stress.add_argument('--quantity', type=int, default=1, help='Tickets per booking')
+
+    issuance = commands.add_parser('ticket-issuance', help='Per-order latency of ticket issuance')
+    issuance.add_argument('--sizes', type=int, nargs='+', default=[1, 10, 100, 1000])
+    issuance.add_argument('--repeats', type=int, default=5)
+
+    hashing = commands.add_parser('password-hashing', help='Logins per second at different bcrypt costs')
+    hashing.add_argument('--rounds', type=int, nargs='+', default=[10, 11, 12, 13])
+    hashing.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    hashing.add_argument('--duration', type=float, default=2.0, help='Seconds to measure each cost inline')
+
+    seating = commands.add_parser('seat-allocation', help='Best-available seat allocation latency')
+    seating.add_argument('--capacity', type=int, default=50000)
+    seating.add_argument('--group-size', type=int, default=4)
+    seating.add_argument('--fills', type=float, nargs='+', default=[0.0, 0.5, 0.9])
+    seating.add_argument('--allocations', type=int, default=1000)
+
+    export = commands.add_parser('ticket-export', help='Streaming CSV/NDJSON export throughput and memory')
+    export.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    export.add_argument('--batch-size', type=int, default=1000)
+
+    indexes = commands.add_parser('index-usage', help='EXPLAIN hot queries against seeded data and check index use')
+    indexes.add_argument('--events', type=int, default=500)
+    indexes.add_argument('--tickets-per-event', type=int, default=20)
+
+    load = commands.add_parser('route-load', help='Concurrent clients against the real routes over generated data')
+    load.add_argument('--clients', type=int, default=16)
+    load.add_argument('--duration', type=float, default=30.0, help='Seconds each client keeps sending requests')
+    load.add_argument('--seed', type=int, default=42)
+
+    lag = commands.add_parser('replica-cache', help='Page cache stays fresh after a booking with a lagging replica')
+    lag.add_argument('--capacity', type=int, default=100)
+    lag.add_argument('--quantity', type=int, default=5)
+
+    args = parser.parse_args()
+    if args.command == 'booking-stress':
+        ok = booking_stress(args.capacity, args.threads, args.attempts, args.quantity)
+        sys.exit(0 if ok else 1)
+    elif args.command == 'ticket-issuance':
+        ticket_issuance(args.sizes, args.repeats)
+    elif args.command == 'password-hashing':
+        password_hashing(args.rounds, args.workers, args.duration)
+    elif args.command == 'seat-allocation':
+        seat_allocation(args.capacity, args.group_size, args.fills, args.allocations)
+    elif args.command == 'ticket-export':
+        ticket_export(args.sizes, args.batch_size)
+    elif args.command == 'index-usage':
+        ok = index_usage(args.events, args.tickets_per_event)
+        sys.exit(0 if ok else 1)
+    elif args.command == 'route-load':
+        route_load(args.clients, args.duration, args.seed)
+    elif args.command == 'replica-cache':
+        ok = replica_cache(args.capacity, args.quantity)
+        sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
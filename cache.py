@@ -0,0 +1,134 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """Thread-safe, size-bounded LRU cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Returns the cached value, or ``default`` if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        """Stores a value, evicting the least recently used entry when full."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class LocalStore:
+    """In-process key/value store: an LRU for values plus counters that are never evicted."""
+
+    def __init__(self, maxsize=1000, ttl=300):
+        self._values = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        return self._values.get(key)
+
+    def set(self, key, value, ttl=None):
+        self._values.set(key, value, ttl)
+
+    def get_counters(self, keys):
+        with self._lock:
+            return [self._counters.get(key, 0) for key in keys]
+
+    def incr(self, key):
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def next_slot(self, key, interval, now):
+        """Returns the first time slot at or after ``now`` and books the one ``interval`` later."""
+        with self._lock:
+            slot = max(self._counters.get(key, 0), now)
+            self._counters[key] = slot + interval
+            return slot
+
+    def get_slot(self, key):
+        with self._lock:
+            return self._counters.get(key, 0)
+
+
+class RedisStore:
+    """Store backed by a Redis-compatible server, shared by every worker process."""
+
+    def __init__(self, url, prefix='eventflow:', ttl=300):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("The 'redis' package is required to use a Redis cache store.")
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+        self.ttl = ttl
+
+    def get(self, key):
+        value = self._client.get(self._prefix + key)
+        return json.loads(value) if value is not None else None
+
+    def set(self, key, value, ttl=None):
+        self._client.set(self._prefix + key, json.dumps(value), ex=self.ttl if ttl is None else ttl)
+
+    def get_counters(self, keys):
+        values = self._client.mget([self._prefix + key for key in keys])
+        return [int(value or 0) for value in values]
+
+    def incr(self, key):
+        return self._client.incr(self._prefix + key)
+
+    # Lua runs atomically on the server, so concurrent workers never book the same slot
+    NEXT_SLOT_SCRIPT = """
+        local now = tonumber(ARGV[1])
+        local slot = math.max(tonumber(redis.call('GET', KEYS[1]) or '0'), now)
+        local following = slot + tonumber(ARGV[2])
+        redis.call('SET', KEYS[1], tostring(following), 'EX', math.ceil(following - now) + 3600)
+        return tostring(slot)
+    """
+
+    def next_slot(self, key, interval, now):
+        """Returns the first time slot at or after ``now`` and books the one ``interval`` later."""
+        return float(self._client.eval(self.NEXT_SLOT_SCRIPT, 1, self._prefix + key, repr(now), repr(interval)))
+
+    def get_slot(self, key):
+        value = self._client.get(self._prefix + key)
+        return float(value) if value is not None else 0
+
+
+def create_store(url=None, maxsize=1000, ttl=300):
+    """Returns a RedisStore for ``redis://`` URLs and a LocalStore otherwise."""
+    if url and url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisStore(url, ttl=ttl)
+    return LocalStore(maxsize=maxsize, ttl=ttl)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+"""
+Synthetic Data Generator for EventFlow
+
+This script seeds the database of the config selected by FLASK_ENV with
+reproducible fake venues, events, ticket types, attendees, orders and tickets
+for load testing. Development and production read DATABASE_URL; testing reads
+TEST_DATABASE_URL and ignores DATABASE_URL. Rows are written with bulk inserts
+in batches, so millions of tickets take minutes rather than hours.
+
+Every generated account uses the password in LOAD_TEST_PASSWORD, which is
+how `benchmark.py route-load` signs its clients in.
+
+Usage:
+    DATABASE_URL=sqlite:///loadtest.db python generate_data.py --create-schema
+    FLASK_ENV=testing TEST_DATABASE_URL=sqlite:///loadtest.db python generate_data.py --create-schema
+    python generate_data.py --events 5000 --orders 1000000 --seed 7
+"""
+
+import argparse
+import datetime
+import random
+import time
+from app import app, db, User, Venue, Event, Speaker, TicketType, Order, Ticket, hash_password, \
+    rebuild_sales_summaries, rebuild_search_index
+
+LOAD_TEST_PASSWORD = 'loadtest'
+LOAD_TEST_DOMAIN = 'loadtest.eventflow.local'
+# Only the ticket types schema.sql's Ticket.type ENUM accepts, so MySQL databases built from it load too
+TICKET_TYPES = [('general admission', 25), ('vip', 120), ('other', 15)]
+CITIES = ['Pune', 'Mumbai', 'Bengaluru', 'Delhi', 'Chennai', 'Hyderabad', 'Kolkata', 'Jaipur']
+WORDS = ('jazz rock summit conference workshop festival meetup python data design '
+         'startup music comedy theatre film science health cloud security').split()
+
+
+def attendee_email(number):
+    return f'attendee{number}@{LOAD_TEST_DOMAIN}'
+
+
+def organizer_email(number):
+    return f'organizer{number}@{LOAD_TEST_DOMAIN}'
+
+
+def next_id(column):
+    return (db.session.query(db.func.max(column)).scalar() or 0) + 1
+
+
+def insert_batches(model, rows, batch_size):
+    """Bulk inserts ``rows`` (an iterable of dicts), committing every ``batch_size`` rows."""
+    batch, total = [], 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            db.session.execute(model.__table__.insert(), batch)
+            db.session.commit()
+            total += len(batch)
+            batch = []
+    if batch:
+        db.session.execute(model.__table__.insert(), batch)
+        db.session.commit()
+        total += len(batch)
+    return total
+
+
+def generate(venues, events, attendees, organizers, orders, max_tickets, days, seed, batch_size):
+    """Seeds the database and returns the number of rows written per table."""
+    rng = random.Random(seed)
+    today = datetime.date.today()
+    password = hash_password(LOAD_TEST_PASSWORD).decode('utf-8')
+    counts = {}
+
+    user_id = next_id(User.user_id)
+    organizer_ids = list(range(user_id, user_id + organizers))
+    attendee_ids = list(range(user_id + organizers, user_id + organizers + attendees))
+    counts['user'] = insert_batches(User, [
+        {'user_id': organizer_ids[n], 'name': f'Organizer {n}', 'email': organizer_email(n),
+         'password': password, 'user_type': 'organizer'}
+        for n in range(organizers)
+    ] + [
+        {'user_id': attendee_ids[n], 'name': f'Attendee {n}', 'email': attendee_email(n),
+         'password': password, 'user_type': 'attendee'}
+        for n in range(attendees)
+    ], batch_size)
+
+    venue_id = next_id(Venue.venue_id)
+    capacities = {venue_id + n: rng.choice([200, 500, 1000, 5000, 20000]) for n in range(venues)}
+    counts['venue'] = insert_batches(Venue, (
+        {'venue_id': vid, 'name': f'{rng.choice(WORDS).title()} Hall {vid}', 'address': f'{vid} Main Road',
+         'capacity': capacity, 'city': rng.choice(CITIES), 'state': None, 'zip_code': None}
+        for vid, capacity in capacities.items()
+    ), batch_size)
+
+    event_id = next_id(Event.event_id)
+    event_rows = []
+    for event in range(event_id, event_id + events):
+        title = ' '.join(rng.sample(WORDS, 3)).title()
+        event_rows.append({
+            'event_id': event, 'name': f'{title} {event}',
+            'description': ' '.join(rng.choices(WORDS, k=20)),
+            'date': today + datetime.timedelta(days=rng.randint(-days, days)),
+            'time': datetime.time(rng.randint(9, 21), rng.choice([0, 30])),
+            'location_id': rng.choice(list(capacities)),
+            'organizer_id': rng.choice(organizer_ids) if organizer_ids else None,
+        })
+    counts['event'] = insert_batches(Event, event_rows, batch_size)
+
+    speaker_id = next_id(Speaker.speaker_id)
+    speakers = []
+    for event in event_rows:
+        for _ in range(rng.randint(1, 3)):
+            speakers.append({'speaker_id': speaker_id, 'name': f'Speaker {speaker_id}',
+                             'bio': ' '.join(rng.choices(WORDS, k=10)), 'event_id': event['event_id']})
+            speaker_id += 1
+    counts['speaker'] = insert_batches(Speaker, speakers, batch_size)
+
+    # Ticket types split the venue's capacity; sales below draw them down
+    ticket_type_id = next_id(TicketType.ticket_type_id)
+    ticket_types = {}
+    for event in event_rows:
+        chosen = TICKET_TYPES[:rng.randint(1, len(TICKET_TYPES))]
+        share = capacities[event['location_id']] // len(chosen)
+        ticket_types[event['event_id']] = [
+            {'ticket_type_id': ticket_type_id + n, 'event_id': event['event_id'], 'type': name,
+             'price': price, 'quantity': share}
+            for n, (name, price) in enumerate(chosen)
+        ]
+        ticket_type_id += len(chosen)
+
+    order_id = next_id(Order.order_id)
+    event_dates = {event['event_id']: event['date'] for event in event_rows}
+    event_ids = list(event_dates)
+
+    def order_rows():
+        nonlocal order_id
+        for _ in range(orders):
+            ticket_type = rng.choice(ticket_types[rng.choice(event_ids)])
+            quantity = min(rng.randint(1, max_tickets), ticket_type['quantity'])
+            if quantity < 1:
+                continue
+            ticket_type['quantity'] -= quantity
+            # Orders are placed in the three months before the event
+            placed = datetime.datetime.combine(event_dates[ticket_type['event_id']], datetime.time()) \
+                - datetime.timedelta(days=rng.randint(1, 90), seconds=rng.randint(0, 86399))
+            yield {'order_id': order_id, 'user_id': rng.choice(attendee_ids), 'date': placed,
+                   'total_price': ticket_type['price'] * quantity, 'payment_id': None}, ticket_type, quantity
+            order_id += 1
+
+    ticket_id = next_id(Ticket.ticket_id)
+    counts['order'] = counts['ticket'] = 0
+    order_batch, ticket_batch = [], []
+    for order, ticket_type, quantity in order_rows():
+        order_batch.append(order)
+        for _ in range(quantity):
+            ticket_batch.append({'ticket_id': ticket_id, 'event_id': ticket_type['event_id'],
+                                 'order_id': order['order_id'], 'price': ticket_type['price'],
+                                 'type': ticket_type['type'], 'seat_number': None})
+            ticket_id += 1
+        if len(ticket_batch) >= batch_size:
+            counts['order'] += insert_batches(Order, order_batch, batch_size)
+            counts['ticket'] += insert_batches(Ticket, ticket_batch, batch_size)
+            order_batch, ticket_batch = [], []
+            print(f"  {counts['order']} orders, {counts['ticket']} tickets...")
+    counts['order'] += insert_batches(Order, order_batch, batch_size)
+    counts['ticket'] += insert_batches(Ticket, ticket_batch, batch_size)
+
+    counts['tickettype'] = insert_batches(
+        TicketType, (row for rows in ticket_types.values() for row in rows), batch_size)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Seed EventFlow with synthetic load-test data')
+    parser.add_argument('--venues', type=int, default=50)
+    parser.add_argument('--events', type=int, default=1000)
+    parser.add_argument('--attendees', type=int, default=10000)
+    parser.add_argument('--organizers', type=int, default=20)
+    parser.add_argument('--orders', type=int, default=100000)
+    parser.add_argument('--max-tickets', type=int, default=4, help='Most tickets in one order')
+    parser.add_argument('--days', type=int, default=365, help='Events are spread this many days either side of today')
+    parser.add_argument('--seed', type=int, default=42, help='Same seed and volumes give the same data')
+    parser.add_argument('--batch-size', type=int, default=10000)
+    parser.add_argument('--create-schema', action='store_true', help='Create missing tables first')
+    args = parser.parse_args()
+
+    with app.app_context():
+        if args.create_schema:
+            db.create_all()
+        started = time.perf_counter()
+        counts = generate(args.venues, args.events, args.attendees, args.organizers, args.orders,
+                          args.max_tickets, args.days, args.seed, args.batch_size)
+        print("Rebuilding sales summaries and search index...")
+        rebuild_sales_summaries()
+        rebuild_search_index()
+        elapsed = time.perf_counter() - started
+
+    for table, count in counts.items():
+        print(f"{table:<12} {count:>10}")
+    print(f"Done in {elapsed:.1f}s. Accounts use the password '{LOAD_TEST_PASSWORD}'.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Initial schema
+
+Revision ID: 52f18bfc2ba6
+Revises: 
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '52f18bfc2ba6'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('email', sa.String(length=255), nullable=False),
+        sa.Column('password', sa.String(length=255), nullable=False),
+        sa.Column('user_type', sa.Enum('organizer', 'attendee', 'administrator'), nullable=False),
+        sa.PrimaryKeyConstraint('user_id'),
+        sa.UniqueConstraint('email')
+    )
+    op.create_table('venue',
+        sa.Column('venue_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('address', sa.Text(), nullable=True),
+        sa.Column('capacity', sa.Integer(), nullable=True),
+        sa.Column('city', sa.String(length=255), nullable=True),
+        sa.Column('state', sa.String(length=255), nullable=True),
+        sa.Column('zip_code', sa.String(length=255), nullable=True),
+        sa.PrimaryKeyConstraint('venue_id')
+    )
+    op.create_table('event',
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('time', sa.Time(), nullable=True),
+        sa.Column('location_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['location_id'], ['venue.venue_id']),
+        sa.PrimaryKeyConstraint('event_id')
+    )
+    # order and payment reference each other; order.payment_id gets its key once payment exists
+    op.create_table('order',
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.DateTime(), nullable=False),
+        sa.Column('total_price', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('payment_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['user.user_id']),
+        sa.PrimaryKeyConstraint('order_id')
+    )
+    op.create_table('payment',
+        sa.Column('payment_id', sa.Integer(), nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('payment_method', sa.Enum('credit card', 'paypal', 'other'), nullable=False),
+        sa.Column('transaction_id', sa.String(length=255), nullable=True),
+        sa.ForeignKeyConstraint(['order_id'], ['order.order_id']),
+        sa.PrimaryKeyConstraint('payment_id'),
+        sa.UniqueConstraint('order_id')
+    )
+    with op.batch_alter_table('order') as batch_op:
+        batch_op.create_foreign_key('fk_order_payment_id_payment', 'payment', ['payment_id'], ['payment_id'])
+    op.create_table('ticket',
+        sa.Column('ticket_id', sa.Integer(), nullable=False),
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('price', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('type', sa.String(length=50), nullable=False),
+        sa.Column('seat_number', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['event_id'], ['event.event_id']),
+        sa.ForeignKeyConstraint(['order_id'], ['order.order_id']),
+        sa.PrimaryKeyConstraint('ticket_id')
+    )
+    op.create_table('speaker',
+        sa.Column('speaker_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('bio', sa.Text(), nullable=True),
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['event_id'], ['event.event_id']),
+        sa.PrimaryKeyConstraint('speaker_id')
+    )
+    op.create_table('tickettype',
+        sa.Column('ticket_type_id', sa.Integer(), nullable=False),
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('type', sa.String(length=50), nullable=False),
+        sa.Column('price', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['event_id'], ['event.event_id']),
+        sa.PrimaryKeyConstraint('ticket_type_id')
+    )
+
+
+def downgrade():
+    op.drop_table('tickettype')
+    op.drop_table('speaker')
+    op.drop_table('ticket')
+    with op.batch_alter_table('order') as batch_op:
+        batch_op.drop_constraint('fk_order_payment_id_payment', type_='foreignkey')
+    op.drop_table('payment')
+    op.drop_table('order')
+    op.drop_table('event')
+    op.drop_table('venue')
+    op.drop_table('user')
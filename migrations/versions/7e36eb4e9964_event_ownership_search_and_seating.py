@@ -0,0 +1,48 @@
+"""Event ownership, catalog indexes, search index and seat uniqueness
+
+Revision ID: 7e36eb4e9964
+Revises: 52f18bfc2ba6
+Create Date: 2026-10-18 09:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7e36eb4e9964'
+down_revision = '52f18bfc2ba6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('event') as batch_op:
+        batch_op.add_column(sa.Column('organizer_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('fk_event_organizer_id_user', 'user', ['organizer_id'], ['user_id'])
+        batch_op.create_index('ix_event_date_event_id', ['date', 'event_id'], unique=False)
+    with op.batch_alter_table('venue') as batch_op:
+        batch_op.create_index('ix_venue_city', ['city'], unique=False)
+    with op.batch_alter_table('ticket') as batch_op:
+        batch_op.create_unique_constraint('uq_ticket_event_seat', ['event_id', 'seat_number'])
+    op.create_table('search_term',
+        sa.Column('term', sa.String(length=64), nullable=False),
+        sa.Column('entity_type', sa.Enum('event', 'venue', 'speaker'), nullable=False),
+        sa.Column('entity_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('weight', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('term', 'entity_type', 'entity_id')
+    )
+    op.create_index('ix_search_term_entity', 'search_term', ['entity_type', 'entity_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_search_term_entity', table_name='search_term')
+    op.drop_table('search_term')
+    with op.batch_alter_table('ticket') as batch_op:
+        batch_op.drop_constraint('uq_ticket_event_seat', type_='unique')
+    with op.batch_alter_table('venue') as batch_op:
+        batch_op.drop_index('ix_venue_city')
+    with op.batch_alter_table('event') as batch_op:
+        batch_op.drop_index('ix_event_date_event_id')
+        batch_op.drop_constraint('fk_event_organizer_id_user', type_='foreignkey')
+        batch_op.drop_column('organizer_id')
@@ -0,0 +1,41 @@
+"""Indexes for hot lookup paths and unique ticket type names per event
+
+Revision ID: 8eb0b95e19ea
+Revises: a4d11eaca35f
+Create Date: 2026-10-18 09:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8eb0b95e19ea'
+down_revision = 'a4d11eaca35f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Fails if an event already has two ticket types with the same name; rename or merge those first
+    with op.batch_alter_table('tickettype') as batch_op:
+        batch_op.create_unique_constraint('uq_tickettype_event_type', ['event_id', 'type'])
+    with op.batch_alter_table('ticket') as batch_op:
+        batch_op.create_index('ix_ticket_event_id_type', ['event_id', 'type'], unique=False)
+        batch_op.create_index('ix_ticket_order_id', ['order_id'], unique=False)
+    with op.batch_alter_table('speaker') as batch_op:
+        batch_op.create_index('ix_speaker_event_id', ['event_id'], unique=False)
+    with op.batch_alter_table('event') as batch_op:
+        batch_op.create_index('ix_event_organizer_id_date', ['organizer_id', 'date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('event') as batch_op:
+        batch_op.drop_index('ix_event_organizer_id_date')
+    with op.batch_alter_table('speaker') as batch_op:
+        batch_op.drop_index('ix_speaker_event_id')
+    with op.batch_alter_table('ticket') as batch_op:
+        batch_op.drop_index('ix_ticket_order_id')
+        batch_op.drop_index('ix_ticket_event_id_type')
+    with op.batch_alter_table('tickettype') as batch_op:
+        batch_op.drop_constraint('uq_tickettype_event_type', type_='unique')
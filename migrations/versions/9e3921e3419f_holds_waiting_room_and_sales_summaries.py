@@ -0,0 +1,67 @@
+"""Inventory holds, waiting room admission rate and sales summaries
+
+Revision ID: 9e3921e3419f
+Revises: 7e36eb4e9964
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9e3921e3419f'
+down_revision = '7e36eb4e9964'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('inventory_hold',
+        sa.Column('hold_id', sa.Integer(), nullable=False),
+        sa.Column('ticket_type_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['ticket_type_id'], ['tickettype.ticket_type_id']),
+        sa.ForeignKeyConstraint(['user_id'], ['user.user_id']),
+        sa.PrimaryKeyConstraint('hold_id')
+    )
+    op.create_index('ix_inventory_hold_expires_at', 'inventory_hold', ['expires_at'], unique=False)
+    op.create_index('ix_inventory_hold_user_id', 'inventory_hold', ['user_id'], unique=False)
+
+    with op.batch_alter_table('event') as batch_op:
+        batch_op.add_column(sa.Column('admission_rate', sa.Integer(), nullable=True))
+
+    op.create_table('event_sales_summary',
+        sa.Column('ticket_type_id', sa.Integer(), nullable=False),
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('sold_count', sa.Integer(), nullable=False),
+        sa.Column('order_count', sa.Integer(), nullable=False),
+        sa.Column('remaining', sa.Integer(), nullable=False),
+        sa.Column('gross_revenue', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['event_id'], ['event.event_id']),
+        sa.ForeignKeyConstraint(['ticket_type_id'], ['tickettype.ticket_type_id']),
+        sa.PrimaryKeyConstraint('ticket_type_id')
+    )
+    op.create_index('ix_event_sales_summary_event_id', 'event_sales_summary', ['event_id'], unique=False)
+    # Start every existing ticket type's summary from its tickets sold so far
+    op.execute(
+        'INSERT INTO event_sales_summary '
+        '(ticket_type_id, event_id, sold_count, order_count, remaining, gross_revenue) '
+        'SELECT tt.ticket_type_id, tt.event_id, COUNT(t.ticket_id), COUNT(DISTINCT t.order_id), '
+        'tt.quantity, COALESCE(SUM(t.price), 0) '
+        'FROM tickettype tt LEFT JOIN ticket t ON t.event_id = tt.event_id AND t.type = tt.type '
+        'GROUP BY tt.ticket_type_id, tt.event_id, tt.quantity'
+    )
+
+
+def downgrade():
+    op.drop_index('ix_event_sales_summary_event_id', table_name='event_sales_summary')
+    op.drop_table('event_sales_summary')
+    with op.batch_alter_table('event') as batch_op:
+        batch_op.drop_column('admission_rate')
+    op.drop_index('ix_inventory_hold_user_id', table_name='inventory_hold')
+    op.drop_index('ix_inventory_hold_expires_at', table_name='inventory_hold')
+    op.drop_table('inventory_hold')
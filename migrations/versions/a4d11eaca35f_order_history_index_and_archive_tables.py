@@ -0,0 +1,96 @@
+"""Order history index and archive tables for past events
+
+Revision ID: a4d11eaca35f
+Revises: 9e3921e3419f
+Create Date: 2026-10-18 09:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4d11eaca35f'
+down_revision = '9e3921e3419f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('order') as batch_op:
+        batch_op.create_index('ix_order_user_id_date', ['user_id', 'date'], unique=False)
+
+    # Archive tables mirror the live tables without foreign keys
+    op.create_table('event_archive',
+        sa.Column('event_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('time', sa.Time(), nullable=True),
+        sa.Column('location_id', sa.Integer(), nullable=False),
+        sa.Column('organizer_id', sa.Integer(), nullable=True),
+        sa.Column('admission_rate', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('event_id')
+    )
+    op.create_index('ix_event_archive_organizer_id_date', 'event_archive', ['organizer_id', 'date'], unique=False)
+    op.create_table('tickettype_archive',
+        sa.Column('ticket_type_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('type', sa.String(length=50), nullable=False),
+        sa.Column('price', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('ticket_type_id')
+    )
+    op.create_index('ix_tickettype_archive_event_id', 'tickettype_archive', ['event_id'], unique=False)
+    op.create_table('speaker_archive',
+        sa.Column('speaker_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('bio', sa.Text(), nullable=True),
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('speaker_id')
+    )
+    op.create_index('ix_speaker_archive_event_id', 'speaker_archive', ['event_id'], unique=False)
+    op.create_table('ticket_archive',
+        sa.Column('ticket_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('price', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('type', sa.String(length=50), nullable=False),
+        sa.Column('seat_number', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('ticket_id')
+    )
+    op.create_index('ix_ticket_archive_event_id', 'ticket_archive', ['event_id'], unique=False)
+    op.create_index('ix_ticket_archive_order_id', 'ticket_archive', ['order_id'], unique=False)
+    op.create_table('order_archive',
+        sa.Column('order_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.DateTime(), nullable=False),
+        sa.Column('total_price', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('payment_id', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('order_id')
+    )
+    op.create_index('ix_order_archive_user_id_date', 'order_archive', ['user_id', 'date'], unique=False)
+    op.create_table('payment_archive',
+        sa.Column('payment_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('payment_method', sa.Enum('credit card', 'paypal', 'other'), nullable=False),
+        sa.Column('transaction_id', sa.String(length=255), nullable=True),
+        sa.PrimaryKeyConstraint('payment_id')
+    )
+    op.create_index('ix_payment_archive_order_id', 'payment_archive', ['order_id'], unique=False)
+
+
+def downgrade():
+    for table, indexes in (
+        ('payment_archive', ['ix_payment_archive_order_id']),
+        ('order_archive', ['ix_order_archive_user_id_date']),
+        ('ticket_archive', ['ix_ticket_archive_order_id', 'ix_ticket_archive_event_id']),
+        ('speaker_archive', ['ix_speaker_archive_event_id']),
+        ('tickettype_archive', ['ix_tickettype_archive_event_id']),
+        ('event_archive', ['ix_event_archive_organizer_id_date']),
+    ):
+        for index in indexes:
+            op.drop_index(index, table_name=table)
+        op.drop_table(table)
+    with op.batch_alter_table('order') as batch_op:
+        batch_op.drop_index('ix_order_user_id_date')
@@ -0,0 +1,68 @@
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import bcrypt
+
+BCRYPT_COST_PATTERN = re.compile(rb'^\$2[abxy]?\$(\d{2})\$')
+
+
+def _hashpw(password, rounds):
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+
+def _checkpw(password, hashed_password):
+    return bcrypt.checkpw(password, hashed_password)
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when too many hashing jobs are already waiting for the pool."""
+
+
+class PasswordHasher:
+    """Runs bcrypt in a bounded process pool so request threads aren't blocked on the GIL.
+
+    The pool is created on first use, so each forked server worker gets its own.
+    ``workers=0`` hashes inline in the calling thread.
+    """
+
+    def __init__(self, rounds=12, workers=None, max_pending=None, wait_timeout=10):
+        self.rounds = rounds
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.wait_timeout = wait_timeout
+        self._slots = threading.BoundedSemaphore(max_pending or max(self.workers, 1) * 4)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _run(self, fn, *args):
+        if self.workers == 0:
+            return fn(*args)
+        if not self._slots.acquire(timeout=self.wait_timeout):
+            raise PasswordHashingBusy('Password hashing queue is full.')
+        try:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor.submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def hash(self, password):
+        """Returns the bcrypt hash of ``password`` at the configured cost."""
+        return self._run(_hashpw, password.encode('utf-8'), self.rounds)
+
+    def verify(self, hashed_password, password):
+        """Checks ``password`` against a stored bcrypt hash."""
+        return self._run(_checkpw, password.encode('utf-8'), hashed_password)
+
+    def needs_rehash(self, hashed_password):
+        """Returns True when a stored hash was made with a different cost than configured."""
+        match = BCRYPT_COST_PATTERN.match(hashed_password)
+        return match is None or int(match.group(1)) != self.rounds
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
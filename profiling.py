@@ -0,0 +1,107 @@
+import heapq
+import itertools
+import threading
+import time
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+
+class RequestProfile:
+    """Wall time, SQL statement count, database time and slowest statements of one request."""
+
+    def __init__(self, keep_slowest=5):
+        self.started = time.perf_counter()
+        self.statements = 0
+        self.db_time = 0.0
+        self.keep_slowest = keep_slowest
+        self._slowest = [] # Min-heap of (duration, sequence, statement)
+        self._sequence = itertools.count()
+
+    def record_statement(self, statement, duration):
+        self.statements += 1
+        self.db_time += duration
+        if self.keep_slowest:
+            entry = (duration, next(self._sequence), statement)
+            if len(self._slowest) < self.keep_slowest:
+                heapq.heappush(self._slowest, entry)
+            elif duration > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def slowest(self):
+        """Returns ``[{'ms', 'sql'}]`` for the slowest statements, slowest first."""
+        return [{'ms': round(duration * 1000, 2), 'sql': ' '.join(statement.split())}
+                for duration, _, statement in sorted(self._slowest, reverse=True)]
+
+    def server_timing(self, total):
+        """Returns a Server-Timing header value splitting ``total`` seconds into app and database time."""
+        return (f'app;dur={total * 1000:.1f}, '
+                f'db;dur={self.db_time * 1000:.1f};desc="{self.statements} SQL statements"')
+
+
+class Histogram:
+    """Cumulative Prometheus-style histogram."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def samples(self, name, labels):
+        for bound, count in zip(self.buckets, self.counts):
+            yield f'{name}_bucket{{{labels},le="{bound:g}"}} {count}'
+        yield f'{name}_bucket{{{labels},le="+Inf"}} {self.count}'
+        yield f'{name}_sum{{{labels}}} {self.sum:.6f}'
+        yield f'{name}_count{{{labels}}} {self.count}'
+
+
+class RequestMetrics:
+    """Per-endpoint request latency, database time and SQL statement histograms of one worker."""
+
+    HISTOGRAMS = (
+        ('request_duration_seconds', 'Request wall time.', DURATION_BUCKETS),
+        ('request_db_seconds', 'Time spent executing SQL statements per request.', DURATION_BUCKETS),
+        ('request_sql_statements', 'SQL statements issued per request.', STATEMENT_BUCKETS),
+    )
+
+    def __init__(self, prefix='eventflow'):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._responses = {}
+
+    def observe(self, endpoint, status, duration, db_time, statements):
+        with self._lock:
+            histograms = self._histograms.get(endpoint)
+            if histograms is None:
+                histograms = self._histograms[endpoint] = [Histogram(buckets) for _, _, buckets in self.HISTOGRAMS]
+            for histogram, value in zip(histograms, (duration, db_time, statements)):
+                histogram.observe(value)
+            key = (endpoint, status)
+            self._responses[key] = self._responses.get(key, 0) + 1
+
+    def render(self):
+        """Returns the metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            name = f'{self.prefix}_requests_total'
+            lines += [f'# HELP {name} Requests handled, by endpoint and status code.', f'# TYPE {name} counter']
+            for (endpoint, status), count in sorted(self._responses.items()):
+                lines.append(f'{name}{{endpoint="{endpoint}",status="{status}"}} {count}')
+            for i, (suffix, help_text, _) in enumerate(self.HISTOGRAMS):
+                name = f'{self.prefix}_{suffix}'
+                lines += [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+                for endpoint, histograms in sorted(self._histograms.items()):
+                    lines.extend(histograms[i].samples(name, f'endpoint="{endpoint}"'))
+        return '\n'.join(lines) + '\n'
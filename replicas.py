@@ -0,0 +1,107 @@
+import itertools
+import threading
+import time
+
+from flask import g, has_request_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, text
+
+
+class Replica:
+    """A read replica engine that is taken out of rotation while it is unreachable."""
+
+    def __init__(self, name, engine):
+        self.name = name
+        self.engine = engine
+        self.healthy = True
+        self.down_since = None
+        self.reads = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+        event.listen(engine, 'handle_error', self._on_error)
+
+    def _on_error(self, context):
+        # Lost connections and failed connects; query errors don't say anything about the server
+        if context.is_disconnect or context.connection is None:
+            self.mark_down()
+
+    def mark_down(self):
+        with self._lock:
+            self.failures += 1
+            if self.healthy:
+                self.healthy = False
+                self.down_since = time.monotonic()
+
+    def is_available(self, retry_interval):
+        """Returns True if the replica is healthy, probing it again once ``retry_interval`` has passed."""
+        if self.healthy:
+            return True
+        with self._lock:
+            if self.healthy or time.monotonic() - self.down_since < retry_interval:
+                return self.healthy
+            # Hold the lock while probing so only one request waits on an unreachable server
+            try:
+                with self.engine.connect() as connection:
+                    connection.execute(text('SELECT 1'))
+            except Exception:
+                self.down_since = time.monotonic()
+                return False
+            self.healthy = True
+            self.down_since = None
+            return True
+
+    def stats(self):
+        return {
+            'healthy': self.healthy,
+            'down_seconds': round(time.monotonic() - self.down_since, 1) if self.down_since else 0,
+            'reads': self.reads,
+            'failures': self.failures,
+        }
+
+
+class ReplicaRouter:
+    """Hands out healthy read replicas in round-robin order."""
+
+    def __init__(self, engines, retry_interval=30):
+        self.replicas = [Replica(name, engine) for name, engine in engines.items()]
+        self.retry_interval = retry_interval
+        self._turn = itertools.count()
+
+    def pick(self):
+        """Returns the next healthy replica, or None if there are none."""
+        count = len(self.replicas)
+        start = next(self._turn)
+        for offset in range(count):
+            replica = self.replicas[(start + offset) % count]
+            if replica.is_available(self.retry_interval):
+                replica.reads += 1
+                return replica
+        return None
+
+    def stats(self):
+        return {replica.name: replica.stats() for replica in self.replicas}
+
+
+def is_write(clause):
+    return clause is not None and (getattr(clause, 'is_dml', False) or
+                                   getattr(clause, '_for_update_arg', None) is not None)
+
+
+class RoutingSession(Session):
+    """Session that sends a request's plain SELECTs to the replica chosen for it.
+
+    A request reads from ``g.read_replica`` (set per request) until it flushes,
+    writes or locks rows; from then on it uses the primary, and ``g.db_wrote``
+    is set so the caller can keep the user on the primary for a while.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_request_context():
+            if self._flushing or is_write(clause):
+                g.db_wrote = True
+                g.read_replica = None
+            elif clause is not None and getattr(clause, 'is_select', False):
+                replica = g.get('read_replica')
+                if replica is not None:
+                    return replica.engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
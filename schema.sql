@@ -3,6 +3,15 @@
 -- USE eventflow_db;
 
 -- Drop existing tables in reverse order of dependency (if re-creating)
+DROP TABLE IF EXISTS event_archive;
+DROP TABLE IF EXISTS tickettype_archive;
+DROP TABLE IF EXISTS speaker_archive;
+DROP TABLE IF EXISTS ticket_archive;
+DROP TABLE IF EXISTS order_archive;
+DROP TABLE IF EXISTS payment_archive;
+DROP TABLE IF EXISTS inventory_hold;
+DROP TABLE IF EXISTS idempotency_key;
+DROP TABLE IF EXISTS event_sales_summary;
 DROP TABLE IF EXISTS Payment;
 DROP TABLE IF EXISTS Ticket;
 DROP TABLE IF EXISTS `Order`; -- Use backticks for reserved keyword
@@ -11,6 +20,7 @@ DROP TABLE IF EXISTS Event;
 DROP TABLE IF EXISTS Venue;
 DROP TABLE IF EXISTS User;
 DROP TABLE IF EXISTS TicketType;
+DROP TABLE IF EXISTS search_term;
 
 
 -- Create User table
@@ -41,7 +51,10 @@ CREATE TABLE Event (
   date DATE NOT NULL,
   time TIME NOT NULL,
   location_id INT NOT NULL,
-  FOREIGN KEY (location_id) REFERENCES Venue(venue_id)
+  organizer_id INT,
+  admission_rate INT, -- Waiting room admissions per minute; NULL = no queue
+  FOREIGN KEY (location_id) REFERENCES Venue(venue_id),
+  FOREIGN KEY (organizer_id) REFERENCES User(user_id)
 );
 
 -- Create Order table
@@ -50,7 +63,8 @@ CREATE TABLE `Order` (
   user_id INT NOT NULL,
   date DATETIME NOT NULL,
   total_price DECIMAL(10,2) NOT NULL,
-  FOREIGN KEY (user_id) REFERENCES User(user_id)
+  FOREIGN KEY (user_id) REFERENCES User(user_id),
+  INDEX ix_order_user_id_date (user_id, date) -- My Tickets pages through a user's orders by date
 );
 
 -- Create Payment table
@@ -75,7 +89,8 @@ CREATE TABLE Ticket (
   type ENUM('general admission', 'vip', 'other') NOT NULL,
   seat_number INT,
   FOREIGN KEY (event_id) REFERENCES Event(event_id),
-  FOREIGN KEY (order_id) REFERENCES `Order`(order_id)
+  FOREIGN KEY (order_id) REFERENCES `Order`(order_id),
+  UNIQUE KEY uq_ticket_event_seat (event_id, seat_number) -- NULL seats (general admission) are exempt
 );
 
 -- Create Speaker table
@@ -97,6 +112,65 @@ CREATE TABLE TicketType (
   FOREIGN KEY (event_id) REFERENCES Event(event_id)
 );
 
+-- Create event_sales_summary table (running sales totals per ticket type)
+CREATE TABLE event_sales_summary (
+  ticket_type_id INT PRIMARY KEY,
+  event_id INT NOT NULL,
+  sold_count INT NOT NULL DEFAULT 0,
+  order_count INT NOT NULL DEFAULT 0,
+  remaining INT NOT NULL DEFAULT 0,
+  gross_revenue DECIMAL(12, 2) NOT NULL DEFAULT 0,
+  FOREIGN KEY (ticket_type_id) REFERENCES TicketType(ticket_type_id),
+  FOREIGN KEY (event_id) REFERENCES Event(event_id),
+  INDEX ix_event_sales_summary_event_id (event_id)
+);
+
+-- Create inventory_hold table (tickets reserved during checkout)
+CREATE TABLE inventory_hold (
+  hold_id INT PRIMARY KEY AUTO_INCREMENT,
+  ticket_type_id INT NOT NULL,
+  user_id INT NOT NULL,
+  quantity INT NOT NULL,
+  created_at DATETIME NOT NULL,
+  expires_at DATETIME NOT NULL,
+  FOREIGN KEY (ticket_type_id) REFERENCES TicketType(ticket_type_id),
+  FOREIGN KEY (user_id) REFERENCES User(user_id),
+  INDEX ix_inventory_hold_user_id (user_id),
+  INDEX ix_inventory_hold_expires_at (expires_at) -- Sweeper walks holds in expiry order
+);
+
+-- Create idempotency_key table (responses replayed for retried bookings and cancellations)
+CREATE TABLE idempotency_key (
+  key_id INT PRIMARY KEY AUTO_INCREMENT,
+  user_id INT NOT NULL, -- No foreign key: keys expire on their own
+  `key` VARCHAR(64) NOT NULL,
+  fingerprint VARCHAR(64) NOT NULL,
+  response TEXT NULL, -- NULL while the first request is still running
+  created_at DATETIME NOT NULL,
+  expires_at DATETIME NOT NULL,
+  CONSTRAINT uq_idempotency_key_user_key UNIQUE (user_id, `key`),
+  INDEX ix_idempotency_key_expires_at (expires_at) -- Purged in expiry order
+);
+
+-- Create search_term table (inverted index for catalog search)
+CREATE TABLE search_term (
+  term VARCHAR(64) NOT NULL,
+  entity_type ENUM('event', 'venue', 'speaker') NOT NULL,
+  entity_id INT NOT NULL,
+  weight FLOAT NOT NULL,
+  PRIMARY KEY (term, entity_type, entity_id),
+  INDEX ix_search_term_entity (entity_type, entity_id)
+);
+
+-- Indexes for hot lookup paths
+CREATE INDEX ix_event_date_event_id ON Event (date, event_id); -- Browse ordering and keyset pagination
+CREATE INDEX ix_venue_city ON Venue (city);
+CREATE INDEX ix_event_organizer_id_date ON Event (organizer_id, date); -- Organizer dashboards
+CREATE INDEX ix_ticket_event_id_type ON Ticket (event_id, type); -- Cancellations and ticket type deletes
+CREATE INDEX ix_ticket_order_id ON Ticket (order_id);
+CREATE INDEX ix_speaker_event_id ON Speaker (event_id);
+ALTER TABLE TicketType ADD CONSTRAINT uq_tickettype_event_type UNIQUE (event_id, type); -- Bookings look types up by name
+
 -- Example Data (Optional)
 -- INSERT INTO User (name, email, password, user_type) VALUES
 -- ('Organizer Bob', 'organizer@example.com', '$2b$12$EXAMPLEHASH...', 'organizer'), -- Replace with actual bcrypt hash
@@ -109,3 +183,13 @@ CREATE TABLE TicketType (
 -- INSERT INTO Event (name, description, date, time, location_id) VALUES
 -- ('Annual Tech Summit 2024', 'The future of tech is here.', '2024-10-15', '09:00:00', 1),
 -- ('Summer Music Festival', 'Live bands all day long.', '2024-08-20', '12:00:00', 2);
+
+-- Archive tables for past events (filled by `flask archive-events`)
+-- CREATE TABLE ... LIKE copies columns and indexes but not foreign keys
+CREATE TABLE event_archive LIKE Event;
+ALTER TABLE event_archive ADD INDEX ix_event_archive_organizer_id_date (organizer_id, date);
+CREATE TABLE tickettype_archive LIKE TicketType;
+CREATE TABLE speaker_archive LIKE Speaker;
+CREATE TABLE ticket_archive LIKE Ticket;
+CREATE TABLE order_archive LIKE `Order`;
+CREATE TABLE payment_archive LIKE Payment;
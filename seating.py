@@ -0,0 +1,110 @@
+import math
+import string
+import threading
+
+
+def describe_seat(seat_number, seats_per_row, rows_per_section):
+    """Returns a human readable location such as ``'Section B, Row 3, Seat 12'``."""
+    index = seat_number - 1
+    row = index // seats_per_row
+    section = row // rows_per_section
+    section_label = string.ascii_uppercase[section] if section < 26 else str(section + 1)
+    return f"Section {section_label}, Row {row % rows_per_section + 1}, Seat {index % seats_per_row + 1}"
+
+
+class SeatMap:
+    """Availability of an event's seats, numbered 1..capacity row by row from the front.
+
+    One byte per seat (0 = free, 1 = taken) keeps a 50k-seat venue at about 50 KB,
+    and free runs are located with ``bytearray.find``, which scans in C.
+    """
+
+    def __init__(self, capacity, seats_per_row=25, rows_per_section=10):
+        self.capacity = capacity
+        self.seats_per_row = seats_per_row
+        self.rows_per_section = rows_per_section
+        self.row_count = math.ceil(capacity / seats_per_row)
+        self._taken = bytearray(capacity)
+        self._free = capacity
+        self._row_free = [self._row_end(row) - row * seats_per_row for row in range(self.row_count)]
+        self._lock = threading.Lock()
+
+    def _row_end(self, row):
+        return min((row + 1) * self.seats_per_row, self.capacity)
+
+    def _set(self, seats, value):
+        for seat in seats:
+            index = seat - 1
+            if 0 <= index < self.capacity and self._taken[index] != value:
+                self._taken[index] = value
+                self._row_free[index // self.seats_per_row] += -1 if value else 1
+                self._free += -1 if value else 1
+
+    def mark_taken(self, seats):
+        with self._lock:
+            self._set(seats, 1)
+
+    def release(self, seats):
+        with self._lock:
+            self._set(seats, 0)
+
+    def is_available(self, seat):
+        return 1 <= seat <= self.capacity and not self._taken[seat - 1]
+
+    def available(self):
+        """Returns the number of free seats."""
+        return self._free
+
+    def allocate(self, count):
+        """Takes the best available ``count`` seats and returns their numbers.
+
+        Prefers a contiguous block in the frontmost row that has one, as close to
+        the middle of the row as possible, and otherwise the frontmost free seats.
+        Returns ``None`` if fewer than ``count`` seats are free.
+        """
+        with self._lock:
+            seats = self._find_contiguous(count) or self._find_scattered(count)
+            if seats:
+                self._set(seats, 1)
+            return seats
+
+    def _find_contiguous(self, count):
+        if count > self.seats_per_row:
+            return None
+        block = bytes(count)
+        # Scan the whole map in C; a match that straddles two rows means nothing fits in that row
+        position = self._taken.find(block)
+        while position != -1:
+            row = position // self.seats_per_row
+            end = self._row_end(row)
+            if position + count <= end:
+                return self._centred_block(row, count, position)
+            position = self._taken.find(block, end)
+        return None
+
+    def _centred_block(self, row, count, first_fit):
+        """Returns the free block in ``row`` closest to the middle of the row."""
+        start, end = row * self.seats_per_row, self._row_end(row)
+        centre = (start + end - count) / 2
+        block = bytes(count)
+        best = first_fit
+        position = self._taken.find(block, first_fit + 1, end)
+        while position != -1 and abs(position - centre) < abs(best - centre):
+            best = position
+            position = self._taken.find(block, position + 1, end)
+        return list(range(best + 1, best + count + 1))
+
+    def _find_scattered(self, count):
+        if self.available() < count:
+            return None
+        seats = []
+        for row in range(self.row_count):
+            if not self._row_free[row]:
+                continue
+            position = self._taken.find(0, row * self.seats_per_row, self._row_end(row))
+            while position != -1 and len(seats) < count:
+                seats.append(position + 1)
+                position = self._taken.find(0, position + 1, self._row_end(row))
+            if len(seats) == count:
+                return seats
+        return None
@@ -0,0 +1,92 @@
+import math
+import threading
+import time
+
+
+class AdmissionMetrics:
+    """Counters describing how many visitors queued and how long they were made to wait."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.joined = 0
+        self.admitted_immediately = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_join(self, wait):
+        with self._lock:
+            self.joined += 1
+            self.admitted_immediately += wait == 0
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'joined': self.joined,
+                'admitted_immediately': self.admitted_immediately,
+                'wait_seconds_total': round(self.wait_total, 3),
+                'wait_seconds_avg': round(self.wait_total / self.joined, 3) if self.joined else 0.0,
+                'wait_seconds_max': round(self.wait_max, 3),
+            }
+
+
+class WaitingRoom:
+    """FIFO queue that admits visitors at a fixed rate, e.g. to an event on sale.
+
+    Joining books the next free admission slot, ``60 / rate`` seconds after the
+    previous one, in a shared store. The visitor keeps the slot time and simply
+    waits for it, so checking one's place in line needs no store or database
+    access, and the order of arrival is the order of admission.
+    """
+
+    def __init__(self, store, admission_window=900):
+        self.store = store
+        self.admission_window = admission_window
+        self.metrics = AdmissionMetrics()
+        self._rates = {}
+
+    def join(self, queue, rate):
+        """Queues a visitor and returns the time they will be admitted.
+
+        ``rate`` is in admissions per minute.
+        """
+        now = time.time()
+        admit_at = self.store.next_slot(f'queue:{queue}', 60 / rate, now)
+        self._rates[queue] = rate
+        self.metrics.record_join(admit_at - now)
+        return admit_at
+
+    def is_admitted(self, admit_at, now=None):
+        """True from ``admit_at`` until the admission window closes."""
+        now = time.time() if now is None else now
+        return admit_at <= now < admit_at + self.admission_window
+
+    def has_expired(self, admit_at, now=None):
+        now = time.time() if now is None else now
+        return now >= admit_at + self.admission_window
+
+    def status(self, admit_at, rate, now=None):
+        """Returns whether the visitor is admitted, their remaining wait and place in line."""
+        now = time.time() if now is None else now
+        wait = max(admit_at - now, 0)
+        return {
+            'admitted': self.is_admitted(admit_at, now),
+            'wait_seconds': math.ceil(wait),
+            'position': math.ceil(wait * rate / 60),
+        }
+
+    def depth(self, queue):
+        """Returns the number of visitors still waiting in ``queue``."""
+        rate = self._rates.get(queue)
+        if not rate:
+            return 0
+        return max(math.ceil((self.store.get_slot(f'queue:{queue}') - time.time()) * rate / 60), 0)
+
+    def stats(self):
+        """Returns queue depth per queue seen by this worker together with the cumulative metrics."""
+        return {
+            'queues': {str(queue): {'rate_per_minute': rate, 'depth': self.depth(queue)}
+                       for queue, rate in list(self._rates.items())},
+            **self.metrics.snapshot(),
+        }